@@ -1,12 +1,37 @@
 import os
 import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 # Define paths relative to the project root
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 RAW_DATA_DIR = os.path.join(BASE_DIR, "data", "raw")
 EXTRACT_DIR = os.path.join(BASE_DIR, "data", "extracted")
 
+# Decompression and file writes release the GIL, so threads overlap well
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _extract_members(zip_path, members):
+    """
+    Copy a batch of zip members to their destination paths.
+
+    Each call opens its own ZipFile handle, since handles are not safe to
+    share between threads.
+
+    Args:
+        zip_path (str): The path to the zip archive.
+        members (list): (member name, destination path) pairs to extract.
+
+    Returns:
+        int: The number of members extracted.
+    """
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        for name, dest_path in members:
+            with zip_ref.open(name) as src, open(dest_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, length=1 << 20)
+    return len(members)
+
 
 def extract_zip(force_extract=False):
     """
@@ -17,17 +42,25 @@ def extract_zip(force_extract=False):
                               Defaults to False.
 
     - Skips extraction if the directory already contains files unless force_extract=True.
-    - Removes unnecessary nested directories (__MACOSX, p17192coll1, etc.) after extraction.
+    - Flattens nested archive directories (p17192coll1, etc.) and ignores __MACOSX entries.
     """
     # Check if the extracted directory already has files
-    if os.path.exists(EXTRACT_DIR) and os.listdir(EXTRACT_DIR) and not force_extract:
-        print(
-            f"⚠️ Extraction skipped: {EXTRACT_DIR} already contains files. Use force_extract=True to override."
-        )
-        return
+    if os.path.exists(EXTRACT_DIR) and not force_extract:
+        # Reading a single entry is enough to know the directory is not empty
+        with os.scandir(EXTRACT_DIR) as entries:
+            if next(entries, None) is not None:
+                print(
+                    f"⚠️ Extraction skipped: {EXTRACT_DIR} already contains files. Use force_extract=True to override."
+                )
+                return
 
     # Find a zip file in the raw data directory
-    zip_files = [f for f in os.listdir(RAW_DATA_DIR) if f.endswith(".zip")]
+    with os.scandir(RAW_DATA_DIR) as entries:
+        zip_files = [
+            entry.name
+            for entry in entries
+            if entry.is_file() and entry.name.endswith(".zip")
+        ]
     if not zip_files:
         print("❌ No zip file found in data/raw.")
         return
@@ -37,30 +70,30 @@ def extract_zip(force_extract=False):
     # Ensure the extracted directory exists and is clean
     os.makedirs(EXTRACT_DIR, exist_ok=True)
 
-    # Extract files
+    # Map each PDF member to a flat path in EXTRACT_DIR, skipping macOS
+    # resource forks, so nothing has to be moved or cleaned up afterwards.
+    # Later members win on duplicate file names, as with sequential writes.
+    targets = {}
     with zipfile.ZipFile(zip_path, "r") as zip_ref:
-        for file in zip_ref.namelist():
-            if file.lower().endswith(".pdf"):
-                zip_ref.extract(file, EXTRACT_DIR)
-
-    print(f"✅ Extracted PDFs to {EXTRACT_DIR}")
-
-    # Cleanup: Move PDFs from nested directories to the root `extracted/`
-    for root, _, files in os.walk(EXTRACT_DIR):
-        for file in files:
-            if file.lower().endswith(".pdf"):
-                src_path = os.path.join(root, file)
-                dest_path = os.path.join(EXTRACT_DIR, file)
-                if src_path != dest_path:  # Prevent unnecessary moves
-                    shutil.move(src_path, dest_path)
-
-    # Remove unnecessary folders (__MACOSX, p17192coll1, etc.)
-    for folder in os.listdir(EXTRACT_DIR):
-        folder_path = os.path.join(EXTRACT_DIR, folder)
-        if os.path.isdir(folder_path):
-            shutil.rmtree(folder_path, ignore_errors=True)
-
-    print("✅ Cleanup complete: All PDFs moved to the extracted directory.")
+        for info in zip_ref.infolist():
+            if info.is_dir() or not info.filename.lower().endswith(".pdf"):
+                continue
+            if "__MACOSX" in info.filename.split("/"):
+                continue
+
+            dest_path = os.path.join(EXTRACT_DIR, os.path.basename(info.filename))
+            targets[dest_path] = info.filename
+
+    # Stream members concurrently, one batch and one zip handle per thread
+    members = [(name, dest_path) for dest_path, name in targets.items()]
+    num_workers = max(1, min(MAX_WORKERS, len(members)))
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        batches = [members[i::num_workers] for i in range(num_workers)]
+        extracted = sum(
+            executor.map(lambda batch: _extract_members(zip_path, batch), batches)
+        )
+
+    print(f"✅ Extracted {extracted} PDFs to {EXTRACT_DIR}")
 
 
 if __name__ == "__main__":
@@ -1,34 +1,211 @@
+import contextlib
+import json
 import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 
-import fitz  # PyMuPDF
-from tqdm import tqdm  # Progress bar
+from src.utils.files import atomic_write_text
+from src.utils.jobs import collect_jobs
+from src.utils.manifest import file_sha256
 
 # Define paths relative to the project root
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data", "extracted")
 OUTPUT_DIR = os.path.join(BASE_DIR, "data", "text_output")
 
+# Suffix of the marker written next to the (empty) text of image-only PDFs
+SCANNED_MARKER_SUFFIX = ".scanned"
+
+# Maps PDF content hashes to the text file already extracted from them
+CACHE_INDEX = os.path.join(OUTPUT_DIR, ".cache_index.json")
+
 # Ensure output directory exists
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 
-def extract_text_from_pdf(pdf_path):
+def _open_pdf(pdf_path):
     """
-    Extract text from a given PDF file using PyMuPDF.
+    Open a PDF with PyMuPDF.
+
+    Args:
+        pdf_path (str): The path to the PDF file.
+
+    Returns:
+        fitz.Document: The opened document.
+    """
+    # PyMuPDF loads the MuPDF C library on import; deferring it keeps runs
+    # with nothing to extract (and imports of this module) fast
+    import fitz  # noqa: PLC0415
+
+    return fitz.open(pdf_path)
+
+
+def _page_text(doc, page_number):
+    """Extract one page's text, loading only that page."""
+    import fitz  # noqa: PLC0415  (lazy, see _open_pdf)
+
+    # Keep whitespace and ligatures as written and clip to the page, but skip
+    # image blocks and CID substitution for unmapped glyphs, which only add
+    # noise for downstream text analysis
+    flags = (
+        fitz.TEXT_PRESERVE_WHITESPACE
+        | fitz.TEXT_PRESERVE_LIGATURES
+        | fitz.TEXT_MEDIABOX_CLIP
+    )
+    return doc.load_page(page_number).get_text("text", flags=flags)
+
+
+def extract_text_to_file(pdf_path, output_path):
+    """
+    Extract text from a given PDF file using PyMuPDF and stream it to a text file.
+
+    Pages are written as they are extracted, so the full document text is
+    never held in memory. The output file only appears once it is complete.
+    PDFs that look image-only get an empty text file plus a ".scanned"
+    marker file next to it.
 
     Args:
         pdf_path (str): The path to the PDF file.
+        output_path (str): The path of the text file to write.
 
     Returns:
-        str: The extracted text from the PDF, or None if an error occurs.
+        bool: True if the text was written, False if an error occurs.
     """
     try:
-        doc = fitz.open(pdf_path)
-        text = "\n".join(page.get_text("text") for page in doc)
-        return text
+        doc = _open_pdf(pdf_path)
     except Exception as e:
         print(f"❌ Skipping {os.path.basename(pdf_path)} (error: {str(e)})")
-        return None
+        return False
+
+    # Text is streamed to a temporary file and moved into place only once
+    # complete, so an interrupted run never leaves a truncated .txt behind
+    # for the skip check to treat as done
+    tmp_path = output_path + ".tmp"
+
+    # Closing the document releases MuPDF's buffers and file handle right away
+    with doc:
+        try:
+            page_count = doc.page_count
+            first_text = _page_text(doc, 0) if page_count else ""
+
+            # Image-only (scanned) PDFs have no text layer. Probe a middle page
+            # before parsing every page just to produce an empty file, and
+            # leave a marker so a later OCR pass can find them.
+            if (
+                page_count > 3
+                and not first_text.strip()
+                and not _page_text(doc, page_count // 2).strip()
+            ):
+                open(output_path + SCANNED_MARKER_SUFFIX, "w").close()
+                open(output_path, "w", encoding="utf-8").close()
+                return True
+
+            with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                f.write(first_text)
+                # One buffered writelines call instead of two writes per page
+                f.writelines(
+                    "\n" + _page_text(doc, page_number)
+                    for page_number in range(1, page_count)
+                )
+            os.replace(tmp_path, output_path)
+            # The PDF may have been image-only when last extracted
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(output_path + SCANNED_MARKER_SUFFIX)
+            return True
+        except Exception as e:
+            print(f"❌ Skipping {os.path.basename(pdf_path)} (error: {str(e)})")
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            return False
+
+
+def load_cache_index():
+    """
+    Load the content-hash cache index.
+
+    Returns:
+        dict: Mapping of PDF SHA-256 digests to text file names.
+    """
+    try:
+        with open(CACHE_INDEX, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache_index(cache_index):
+    """
+    Save the content-hash cache index.
+
+    Args:
+        cache_index (dict): Mapping of PDF SHA-256 digests to text file names.
+    """
+    atomic_write_text(CACHE_INDEX, json.dumps(cache_index, indent=2))
+
+
+def _forget_output(cache_index, digest_by_output, output_filename):
+    """
+    Drop the cache index entry pointing at a text file.
+
+    Called before a text file is rewritten, so the digest of the PDF it used
+    to come from no longer resolves to its new contents.
+
+    Args:
+        cache_index (dict): Mapping of PDF SHA-256 digests to text file names.
+        digest_by_output (dict): The reverse mapping, kept in step with it.
+        output_filename (str): Name of the text file being rewritten.
+    """
+    digest = digest_by_output.pop(output_filename, None)
+    if digest is not None:
+        del cache_index[digest]
+
+
+def _record_output(cache_index, digest_by_output, digest, output_filename):
+    """
+    Point a PDF digest at the text file just extracted from it.
+
+    Args:
+        cache_index (dict): Mapping of PDF SHA-256 digests to text file names.
+        digest_by_output (dict): The reverse mapping, kept in step with it.
+        digest (str): SHA-256 digest of the PDF.
+        output_filename (str): Name of the text file extracted from it.
+    """
+    _forget_output(cache_index, digest_by_output, output_filename)
+    previous = cache_index.get(digest)
+    if previous is not None:
+        del digest_by_output[previous]
+    cache_index[digest] = output_filename
+    digest_by_output[output_filename] = digest
+
+
+def _init_worker():
+    """Silence MuPDF error output in a worker; failures are reported per file."""
+    import fitz  # noqa: PLC0415  (lazy, see _open_pdf)
+
+    fitz.TOOLS.mupdf_display_errors(False)
+
+
+def _extract_and_write(task):
+    """
+    Extract text from one PDF and save it; runs in a worker process.
+
+    Args:
+        task (tuple): (pdf_path, output_path) pair.
+
+    Returns:
+        str: The output path, or None if extraction or saving failed.
+    """
+    import fitz  # noqa: PLC0415  (lazy, see _open_pdf)
+
+    pdf_path, output_path = task
+    ok = extract_text_to_file(pdf_path, output_path)
+
+    # MuPDF accumulates warnings and cached resources (fonts, images)
+    # process-wide; nothing carries over between PDFs, so drop both
+    fitz.TOOLS.mupdf_warnings(reset=True)
+    fitz.TOOLS.store_shrink(100)
+
+    return output_path if ok else None
 
 
 def process_all_pdfs(force_extract=False):
@@ -39,46 +216,97 @@ def process_all_pdfs(force_extract=False):
         force_extract (bool): If True, reprocess all PDFs even if the text files already exist. Defaults to False.
 
     - Skips already processed PDFs unless force_extract=True.
+    - Copies the text of byte-identical PDFs (e.g. renamed copies) instead of re-extracting.
     - Provides clear console output on which files are processed vs. skipped.
     """
-    if not os.path.exists(DATA_DIR) or not any(
-        f.endswith(".pdf") for f in os.listdir(DATA_DIR)
-    ):
+    if not os.path.exists(DATA_DIR):
         print("❌ No PDFs found in extracted directory. Run extract_data.py first.")
         return
 
-    pdf_files = [
-        f
-        for f in os.listdir(DATA_DIR)
-        # Filter out hidden files and non-PDF files
-        if f.lower().endswith(".pdf") and not f.startswith("._")
-    ]
-    num_files = len(pdf_files)
+    # One pass over each directory: input PDFs and already-written outputs
+    pdf_jobs = collect_jobs(DATA_DIR, ".pdf", OUTPUT_DIR, ".txt")
+    num_files = len(pdf_jobs)
 
     if num_files == 0:
-        print("❌ No valid PDFs found. Hidden files may have been filtered.")
+        print("❌ No valid PDFs found. Run extract_data.py first.")
         return
 
     print(f"📂 Processing {num_files} PDFs...\n")
 
-    for filename in tqdm(pdf_files, desc="Extracting PDFs", unit="file"):
-        pdf_path = os.path.join(DATA_DIR, filename)
-        output_filename = os.path.splitext(filename)[0] + ".txt"
-        output_path = os.path.join(OUTPUT_DIR, output_filename)
+    # Entries whose text file has since been deleted can never be copied. The
+    # reverse mapping finds a text file's entry without scanning the index,
+    # and keeps only one digest per text file.
+    saved_index = load_cache_index()
+    existing_outputs = set(os.listdir(OUTPUT_DIR))
+    digest_by_output = {
+        name: digest for digest, name in saved_index.items() if name in existing_outputs
+    }
+    cache_index = {digest: name for name, digest in digest_by_output.items()}
+
+    pending = []
+    for job in pdf_jobs:
+        pdf_path, output_path = job.input_path, job.output_path
+        output_filename = os.path.basename(output_path)
 
         # Skip if text file already exists (unless force_extract is set)
-        if os.path.exists(output_path) and not force_extract:
-            continue  # Skip without printing, since tqdm provides progress feedback
+        if job.output_exists and not force_extract:
+            continue
 
-        text = extract_text_from_pdf(pdf_path)
+        # Reuse the text of a byte-identical PDF extracted under another name
+        digest = file_sha256(pdf_path)
+        cached = cache_index.get(digest)
+        if not force_extract and cached is not None and cached != output_filename:
+            cached_path = os.path.join(OUTPUT_DIR, cached)
+            if os.path.exists(cached_path):
+                shutil.copyfile(cached_path, output_path + ".tmp")
+                os.replace(output_path + ".tmp", output_path)
+                _forget_output(cache_index, digest_by_output, output_filename)
+                # A copy of a scanned PDF is scanned too
+                marker_path = output_path + SCANNED_MARKER_SUFFIX
+                if os.path.exists(cached_path + SCANNED_MARKER_SUFFIX):
+                    open(marker_path, "w").close()
+                else:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(marker_path)
+                continue
 
-        # Skip saving if extraction failed
-        if text is None:
-            continue
+        pending.append((os.path.getsize(pdf_path), pdf_path, output_path, digest))
+
+    # Parse time grows with file size, so dispatch the largest PDFs first and
+    # one at a time; small files then fill in around them instead of a large
+    # one starting last and straggling
+    pending.sort(reverse=True)
+    tasks = [(pdf_path, output_path) for _, pdf_path, output_path, _ in pending]
+    digests = [digest for *_, digest in pending]
+
+    if tasks:
+        from tqdm import tqdm  # noqa: PLC0415  (only needed once work is queued)
+
+        # Each PDF is independent, so fan extraction out across all cores
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(), initializer=_init_worker
+        ) as executor:
+            results = executor.map(_extract_and_write, tasks, chunksize=1)
+            for digest, saved_path in tqdm(
+                zip(digests, results),
+                total=len(tasks),
+                desc="Extracting PDFs",
+                unit="file",
+                # Redraw at most twice a second; fast PDFs finish far quicker
+                mininterval=0.5,
+                smoothing=0,
+            ):
+                if saved_path is not None:
+                    _record_output(
+                        cache_index,
+                        digest_by_output,
+                        digest,
+                        os.path.basename(saved_path),
+                    )
 
-        # Save text to output file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(text)
+    # Written once per run rather than after every PDF
+    if cache_index != saved_index:
+        save_cache_index(cache_index)
 
     print("\n✅ Extraction complete! All available PDFs have been processed.")
 
@@ -1,10 +1,76 @@
-import importlib.metadata
+import json
 import os
+import re
 import shutil
-import subprocess
 import sys
+import sysconfig
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, NamedTuple, Tuple
+
+# pip treats "#" at the start of a line or after whitespace as a comment
+_COMMENT_RE = re.compile(r"(^|\s)#.*$")
+
+# Everything after the package name: version specifiers, extras, markers
+_SPECIFIER_RE = re.compile(r"[<>=!~;\[\s]")
+
+
+def _requirement_name(requirement: str) -> str:
+    """Extract the distribution name from a requirements.txt line.
+
+    Args:
+        requirement (str): A requirement line with comments removed.
+
+    Returns:
+        str: The distribution name.
+    """
+    # packaging is installed alongside pip/pytest, but this script may run in
+    # a fresh environment before anything else is installed
+    try:
+        from packaging.requirements import InvalidRequirement, Requirement
+
+        return Requirement(requirement).name
+    except ImportError:
+        pass
+    except InvalidRequirement:
+        pass
+    # Lenient fallback for malformed lines or when packaging is unavailable
+    return _SPECIFIER_RE.split(requirement, maxsplit=1)[0].strip()
+
+
+# Remembers a passing requirements check until the environment changes
+REQUIREMENTS_CACHE = (
+    Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    / "ecological-extractor"
+    / "setup_check.json"
+)
+
+
+def _requirements_cache_key(requirements_file: Path) -> List[str]:
+    """Build the cache key for a requirements check.
+
+    The key changes whenever the requirements file is edited, a different
+    interpreter or environment is used, or packages are installed into or
+    removed from site-packages (which changes the directory's mtime).
+
+    Args:
+        requirements_file (Path): The requirements file being checked.
+
+    Returns:
+        List[str]: The cache key.
+    """
+    key = [
+        str(requirements_file.resolve()),
+        str(requirements_file.stat().st_mtime_ns),
+        sys.prefix,
+        sys.executable,
+    ]
+    paths = sysconfig.get_paths()
+    for site_dir in sorted({paths["purelib"], paths["platlib"]}):
+        try:
+            key.append(f"{site_dir}:{os.stat(site_dir).st_mtime_ns}")
+        except OSError:
+            key.append(f"{site_dir}:missing")
+    return key
 
 
 def check_virtual_env() -> bool:
@@ -47,52 +113,59 @@ def check_requirements(debug: bool = False) -> bool:
         print("   Please ensure you're in the correct directory")
         return False
 
-    # Read requirements file
+    # Skip the check entirely if it already passed for this exact environment
+    cache_key = _requirements_cache_key(requirements_file)
+    if not debug:
+        try:
+            cached_key = json.loads(REQUIREMENTS_CACHE.read_text(encoding="utf-8"))
+            if cached_key == cache_key:
+                print("✅ All required packages are installed (cached)")
+                return True
+        except (OSError, ValueError):
+            pass
+
+    # importlib.metadata and packaging (in _requirement_name) are only imported
+    # past the cache check; together they account for most of this script's
+    # import time
+    import importlib.metadata
+
+    # Read requirements file, dropping comments and blank lines
     with open(requirements_file) as f:
         requirements = [
-            line.strip() for line in f if line.strip() and not line.startswith("#")
+            requirement
+            for requirement in (_COMMENT_RE.sub("", line).strip() for line in f)
+            if requirement
         ]
 
-    # Get all installed distributions and their metadata
-    installed_packages = {}
+    # The full distribution scan is only needed to print the debug listing
     if debug:
         print("\nDebug: Full package list:")
-    for dist in importlib.metadata.distributions():
-        try:
-            name = dist.metadata["Name"]
-            version = dist.version
-            normalized_name = name.lower().replace("-", ".").replace("_", ".")
-            installed_packages[normalized_name] = version
-            if debug:
+        installed_count = 0
+        for dist in importlib.metadata.distributions():
+            try:
+                name = dist.metadata["Name"]
+                version = dist.version
+                normalized_name = name.lower().replace("-", ".").replace("_", ".")
+                installed_count += 1
                 print(
                     f"  Original name: {name}, Normalized: {normalized_name}, Version: {version}"
                 )
-        except Exception as e:
-            if debug:
+            except Exception as e:
                 print(f"Warning: Error processing package {dist}: {e}")
+        print(f"\nTotal packages found: {installed_count}")
 
-    if debug:
-        print(f"\nTotal packages found: {len(installed_packages)}")
-
+    # Look up each requirement directly instead of indexing every distribution
     missing = []
     for requirement in requirements:
-        package = (
-            requirement.split("==")[0]
-            .split(">=")[0]
-            .split("<=")[0]
-            .split(">")[0]
-            .split("<")[0]
-            .strip()
-        )
-        normalized_package = package.lower().replace("-", ".").replace("_", ".")
+        package = _requirement_name(requirement)
+        try:
+            installed_version = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            installed_version = None
+            missing.append(package)
         if debug:
             print(f"\nDebug: Checking requirement: {package}")
-            print(f"  Normalized name: {normalized_package}")
-            print(
-                f"  Found in installed packages: {normalized_package in installed_packages}"
-            )
-        if normalized_package not in installed_packages:
-            missing.append(package)
+            print(f"  Installed version: {installed_version}")
 
     if missing:
         print("❌ Some required packages are missing:")
@@ -103,6 +176,13 @@ def check_requirements(debug: bool = False) -> bool:
         return False
 
     print("✅ All required packages are installed")
+
+    # Only passing checks are cached, so missing packages are always reported
+    try:
+        REQUIREMENTS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        REQUIREMENTS_CACHE.write_text(json.dumps(cache_key), encoding="utf-8")
+    except OSError:
+        pass
     return True
 
 
@@ -123,6 +203,44 @@ def check_git_repo() -> bool:
     return True
 
 
+class ExternalDependency(NamedTuple):
+    key: str
+    name: str
+    needed_for: str
+    executables: Tuple[str, ...]
+
+
+# Recommended external tools, fixed for the lifetime of the process
+_EXTERNAL_DEPENDENCIES: Tuple[ExternalDependency, ...] = (
+    ExternalDependency("tesseract", "Tesseract OCR", "OCR processing", ("tesseract",)),
+    ExternalDependency("ffmpeg", "ffmpeg", "audio transcription", ("ffmpeg",)),
+)
+if os.name == "nt":  # Ghostscript is only needed for table extraction on Windows
+    _EXTERNAL_DEPENDENCIES += (
+        ExternalDependency(
+            "ghostscript",
+            "Ghostscript",
+            "table extraction on Windows",
+            ("gswin64c", "gswin32c"),
+        ),
+    )
+
+
+def _is_installed(executables: Tuple[str, ...]) -> bool:
+    """Check whether any of a dependency's executables is on PATH.
+
+    Running the tool (e.g. "--version") could only succeed if PATH lookup
+    does, so the lookup alone answers the question without a subprocess.
+
+    Args:
+        executables (Tuple[str, ...]): Executable names that provide the dependency.
+
+    Returns:
+        bool: True if the dependency was found, False otherwise.
+    """
+    return any(shutil.which(executable) for executable in executables)
+
+
 def check_external_dependencies() -> Dict[str, bool]:
     """Check if recommended external dependencies are installed.
 
@@ -135,113 +253,94 @@ def check_external_dependencies() -> Dict[str, bool]:
     print("\nChecking external dependencies (informational):")
 
     results = {}
-
-    # Check for Tesseract OCR (needed for OCR processing)
-    try:
-        result = subprocess.run(
-            ["tesseract", "--version"], capture_output=True, text=True, check=False
-        )
-        if result.returncode == 0:
-            print("✅ Tesseract OCR is installed")
-            results["tesseract"] = True
+    for dependency in _EXTERNAL_DEPENDENCIES:
+        found = _is_installed(dependency.executables)
+        if found:
+            print(f"✅ {dependency.name} is installed")
         else:
-            print("ℹ️ Tesseract OCR not found (needed for OCR processing)")
-            _print_install_instructions("tesseract")
-            results["tesseract"] = False
-    except (FileNotFoundError, subprocess.SubprocessError):
-        print("ℹ️ Tesseract OCR not found (needed for OCR processing)")
-        _print_install_instructions("tesseract")
-        results["tesseract"] = False
-
-    # Check for ffmpeg (needed for audio transcription)
-    try:
-        result = subprocess.run(
-            ["ffmpeg", "-version"], capture_output=True, text=True, check=False
-        )
-        if result.returncode == 0:
-            print("✅ ffmpeg is installed")
-            results["ffmpeg"] = True
-        else:
-            print("ℹ️ ffmpeg not found (needed for audio transcription)")
-            _print_install_instructions("ffmpeg")
-            results["ffmpeg"] = False
-    except (FileNotFoundError, subprocess.SubprocessError):
-        print("ℹ️ ffmpeg not found (needed for audio transcription)")
-        _print_install_instructions("ffmpeg")
-        results["ffmpeg"] = False
-
-    # Check for Ghostscript (needed for table extraction on Windows)
-    if os.name == "nt":  # Windows check
-        try:
-            # Try to find gswin64c.exe or gswin32c.exe in PATH
-            gs_path = shutil.which("gswin64c") or shutil.which("gswin32c")
-            if gs_path:
-                print("✅ Ghostscript is installed")
-                results["ghostscript"] = True
-            else:
-                print(
-                    "ℹ️ Ghostscript not found (needed for table extraction on Windows)"
-                )
-                _print_install_instructions("ghostscript")
-                results["ghostscript"] = False
-        except Exception:
-            print("ℹ️ Ghostscript not found (needed for table extraction on Windows)")
-            _print_install_instructions("ghostscript")
-            results["ghostscript"] = False
+            print(
+                f"ℹ️ {dependency.name} not found "
+                f"(needed for {dependency.needed_for})"
+            )
+            _print_install_instructions(dependency.key)
+        results[dependency.key] = found
 
     return results
 
 
+# The platform never changes while the script runs, so pick it once
+if os.name == "nt":
+    _PLATFORM = "windows"
+elif os.name == "posix":
+    _PLATFORM = "macos" if sys.platform == "darwin" else "linux"
+else:
+    _PLATFORM = ""
+
+# Installation instructions per dependency and platform
+_INSTALL_INSTRUCTIONS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "tesseract": {
+        "windows": (
+            "   To install Tesseract OCR on Windows:",
+            "   1. Download from https://github.com/UB-Mannheim/tesseract/wiki",
+            '   2. Add to PATH: setx PATH "%PATH%;C:\\Program Files\\Tesseract-OCR"',
+            "   3. Verify with: tesseract --version",
+        ),
+        "macos": (
+            "   To install Tesseract OCR on macOS:",
+            "   1. Run: brew install tesseract",
+            "   2. Verify with: tesseract --version",
+        ),
+        "linux": (
+            "   To install Tesseract OCR on Linux:",
+            "   1. Run: sudo apt-get update && sudo apt-get install -y tesseract-ocr",
+            "   2. Verify with: tesseract --version",
+        ),
+    },
+    "ffmpeg": {
+        "windows": (
+            "   To install ffmpeg on Windows:",
+            "   1. Download from https://ffmpeg.org/download.html",
+            "   2. Extract files and add bin folder to PATH",
+            "   3. Verify with: ffmpeg -version",
+        ),
+        "macos": (
+            "   To install ffmpeg on macOS:",
+            "   1. Run: brew install ffmpeg",
+            "   2. Verify with: ffmpeg -version",
+        ),
+        "linux": (
+            "   To install ffmpeg on Linux:",
+            "   1. Run: sudo apt-get update && sudo apt-get install -y ffmpeg",
+            "   2. Verify with: ffmpeg -version",
+        ),
+    },
+    "ghostscript": {
+        "windows": (
+            "   To install Ghostscript on Windows:",
+            "   1. Download from https://ghostscript.com/releases/gsdnld.html",
+            "   2. Run the installer (it will add to PATH automatically)",
+            "   3. Verify with: gswin64c -version",
+        ),
+    },
+}
+
+# The current platform's instructions, pre-joined so printing is one lookup
+_INSTALL_FOR_PLATFORM: Dict[str, str] = {
+    dependency: "\n".join(platforms[_PLATFORM])
+    for dependency, platforms in _INSTALL_INSTRUCTIONS.items()
+    if _PLATFORM in platforms
+}
+
+
 def _print_install_instructions(dependency: str) -> None:
     """Print installation instructions for a specific dependency.
 
     Args:
         dependency (str): Name of the dependency to show instructions for.
     """
-    if dependency == "tesseract":
-        if os.name == "nt":  # Windows
-            print("   To install Tesseract OCR on Windows:")
-            print("   1. Download from https://github.com/UB-Mannheim/tesseract/wiki")
-            print(
-                '   2. Add to PATH: setx PATH "%PATH%;C:\\Program Files\\Tesseract-OCR"'
-            )
-            print("   3. Verify with: tesseract --version")
-        elif os.name == "posix":  # Linux/macOS
-            if sys.platform == "darwin":  # macOS
-                print("   To install Tesseract OCR on macOS:")
-                print("   1. Run: brew install tesseract")
-                print("   2. Verify with: tesseract --version")
-            else:  # Linux
-                print("   To install Tesseract OCR on Linux:")
-                print(
-                    "   1. Run: sudo apt-get update && sudo apt-get install -y tesseract-ocr"
-                )
-                print("   2. Verify with: tesseract --version")
-
-    elif dependency == "ffmpeg":
-        if os.name == "nt":  # Windows
-            print("   To install ffmpeg on Windows:")
-            print("   1. Download from https://ffmpeg.org/download.html")
-            print("   2. Extract files and add bin folder to PATH")
-            print("   3. Verify with: ffmpeg -version")
-        elif os.name == "posix":  # Linux/macOS
-            if sys.platform == "darwin":  # macOS
-                print("   To install ffmpeg on macOS:")
-                print("   1. Run: brew install ffmpeg")
-                print("   2. Verify with: ffmpeg -version")
-            else:  # Linux
-                print("   To install ffmpeg on Linux:")
-                print(
-                    "   1. Run: sudo apt-get update && sudo apt-get install -y ffmpeg"
-                )
-                print("   2. Verify with: ffmpeg -version")
-
-    elif dependency == "ghostscript":
-        if os.name == "nt":  # Windows
-            print("   To install Ghostscript on Windows:")
-            print("   1. Download from https://ghostscript.com/releases/gsdnld.html")
-            print("   2. Run the installer (it will add to PATH automatically)")
-            print("   3. Verify with: gswin64c -version")
+    instructions = _INSTALL_FOR_PLATFORM.get(dependency)
+    if instructions:
+        print(instructions)
 
 
 def main(debug: bool = False) -> int:
@@ -14,29 +14,37 @@ Quality Metrics:
 
 Extraction Methods:
 1. PDFPlumber (primary) - For structured tables with clear borders
-2. Camelot (fallback) - For complex or borderless tables
+2. PyMuPDF (fallback) - Fast table detection for tables pdfplumber misses
+3. Camelot (optional fallback, --use-camelot) - For complex or borderless tables
 
 Usage:
-    python table_extraction.py [--force] [--min-quality FLOAT]
+    python -m src.table_extraction [--force] [--save-csv] [--use-camelot]
 """
 
 import argparse
+import csv
 import json
 import logging
+import os
 import re
-import statistics
 import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
-import camelot
-import pandas as pd
-import pdfplumber
 from tqdm import tqdm
 
-warnings.filterwarnings("ignore", category=UserWarning, module="camelot")
+from src.utils.manifest import file_sha256
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 # Type hints for clarity
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -51,10 +59,15 @@ TABLE_CSV_DIR = TABLES_DIR / "csv"
 TABLE_JSON_DIR = TABLES_DIR / "json"
 LOG_DIR = TABLES_DIR / "logs"
 LOG_FILE = LOG_DIR / "table_extraction.log"
-PROCESSED_MANIFEST = TABLES_DIR / "processed_manifest.json"
+PROCESSED_MANIFEST = TABLES_DIR / "processed_manifest.jsonl"
+LEGACY_MANIFEST = TABLES_DIR / "processed_manifest.json"
+CACHE_DIR = TABLES_DIR / "cache"
 
 # Required directories
-REQUIRED_DIRS = [TABLE_CSV_DIR, TABLE_JSON_DIR, LOG_DIR]
+REQUIRED_DIRS = [TABLE_CSV_DIR, TABLE_JSON_DIR, LOG_DIR, CACHE_DIR]
+
+# Bump when extraction or scoring changes to invalidate cached results
+CACHE_VERSION = 4
 
 # Quality thresholds
 TQS_THRESHOLD = 0.5  # Tables below this score will be discarded
@@ -67,23 +80,35 @@ QUALITY_THRESHOLDS = {
 # Penalties
 FIRST_PAGE_PENALTY = 0.4  # Penalty for tables on the first page
 
-HEADER_KEYWORDS = {
-    "table",
-    "id",
-    "name",
-    "date",
-    "year",
-    "value",
-    "category",
-    "type",
-    "species",
-    "count",
-    "total",
-    "number",
-    "description",
-    "location",
-    "site",
-}
+HEADER_KEYWORDS = frozenset(
+    {
+        "table",
+        "id",
+        "name",
+        "date",
+        "year",
+        "value",
+        "category",
+        "type",
+        "species",
+        "count",
+        "total",
+        "number",
+        "description",
+        "location",
+        "site",
+    }
+)
+
+# Cell classification patterns, compiled once instead of per cell
+_SPECIAL_RE = re.compile(r"[^\w\s.,%-]")
+_NUMERIC_RE = re.compile(r"^[\d.,%-]+\Z")
+
+# ASCII lookup tables derived from the patterns above: deleting the allowed
+# bytes from an ASCII cell leaves something only if it has a special
+# character, and deleting the numeric bytes leaves nothing only if it is numeric
+_ASCII_ALLOWED = bytes(b for b in range(128) if not _SPECIAL_RE.match(chr(b)))
+_ASCII_NUMERIC = bytes(b for b in range(128) if _NUMERIC_RE.match(chr(b)))
 
 
 @contextmanager
@@ -151,19 +176,20 @@ def compute_table_quality(table: List[List[str]], page_number: int) -> float:
         return 0.0
 
     try:
-        # Get metrics
-        total_cells, non_empty, special_chars, numeric = compute_content_metrics(table)
-        col_consistency = compute_structure_metrics(table)  # This was missing
-        cluster_penalty = compute_empty_cell_clustering(table)
+        # Get metrics: one pass over every cell, plus the header row
+        metrics = _table_metrics(table)
         header_score = compute_header_analysis(table)
 
         # Avoid division by zero
-        if total_cells == 0:
+        if metrics.total_cells == 0:
             return 0.0
 
+        col_consistency = 1 / (1 + metrics.col_variance)
+        cluster_penalty = metrics.empty_rows / len(table)
+
         # Calculate final score
         final_score = (
-            0.4 * (non_empty / total_cells)
+            0.4 * (metrics.non_empty / metrics.total_cells)
             + 0.3 * col_consistency
             + 0.3 * header_score
             - 0.2 * cluster_penalty
@@ -173,42 +199,91 @@ def compute_table_quality(table: List[List[str]], page_number: int) -> float:
         return max(0.0, min(1.0, round(final_score, 2)))
 
     except Exception as e:
-        logger.error(f"Error computing table quality: {str(e)}")
+        logger.error("Error computing table quality: %s", e)
         return 0.0
 
 
-def compute_content_metrics(table: List[List[str]]) -> tuple:
-    """Compute content metrics for the table."""
+class _TableMetrics(NamedTuple):
+    total_cells: int
+    non_empty: int
+    special_chars: int
+    numeric: int
+    col_variance: float
+    empty_rows: int
+
+
+def _table_metrics(table: List[List[str]]) -> _TableMetrics:
+    """
+    Compute the content, structure and empty-cell statistics of a table.
+
+    All of them are accumulated in a single pass over the rows and cells,
+    rather than one pass per metric.
+    """
     total_cells = 0
     non_empty = 0
     special_chars = 0
     numeric = 0
+    sum_len_sq = 0
+    empty_rows = 0
+
+    # Bind the per-cell lookups locally rather than as globals in the loop
+    ascii_allowed = _ASCII_ALLOWED
+    ascii_numeric = _ASCII_NUMERIC
+    special_search = _SPECIAL_RE.search
+    numeric_match = _NUMERIC_RE.match
 
     for row in table:
-        total_cells += len(row)
+        row_len = len(row)
+        total_cells += row_len
+        sum_len_sq += row_len * row_len
+        if row.count("") > row_len // 2:
+            empty_rows += 1
+
         for cell in row:
-            if cell is not None and str(cell).strip():
-                non_empty += 1
-                if re.search(r"[^\w\s.,%-]", str(cell)):
+            if cell is None:
+                continue
+            # Whitespace is never special, so stripping does not change either test
+            text = str(cell).strip()
+            if not text:
+                continue
+            non_empty += 1
+            if text.isascii():
+                raw = text.encode("ascii")
+                if raw.translate(None, ascii_allowed):
+                    special_chars += 1
+                if not raw.translate(None, ascii_numeric):
+                    numeric += 1
+            else:
+                # Unicode letters and digits need the full regex semantics
+                if special_search(text):
                     special_chars += 1
-                if re.match(r"^[\d.,%-]+$", str(cell).strip()):
+                if numeric_match(text):
                     numeric += 1
 
-    return total_cells, non_empty, special_chars, numeric
+    # Population variance of the row lengths from integer sums: exact, so it
+    # matches statistics.pvariance without its Fraction arithmetic
+    n = len(table)
+    col_variance = (n * sum_len_sq - total_cells * total_cells) / (n * n) if n else 0.0
+
+    return _TableMetrics(
+        total_cells, non_empty, special_chars, numeric, col_variance, empty_rows
+    )
+
+
+def compute_content_metrics(table: List[List[str]]) -> tuple:
+    """Compute content metrics for the table."""
+    return tuple(_table_metrics(table)[:4])
 
 
 def compute_structure_metrics(table: List[List[str]]) -> float:
     """Compute structure metrics for the table."""
-    col_lengths = [len(row) for row in table]
-    col_variance = statistics.pvariance(col_lengths) if len(col_lengths) > 1 else 0
-    col_consistency = 1 / (1 + col_variance)
+    col_consistency = 1 / (1 + _table_metrics(table).col_variance)
     return col_consistency
 
 
 def compute_empty_cell_clustering(table: List[List[str]]) -> float:
     """Compute empty cell clustering penalty for the table."""
-    empty_clusters = sum(1 for row in table if row.count("") > len(row) // 2)
-    cluster_penalty = empty_clusters / len(table)
+    cluster_penalty = _table_metrics(table).empty_rows / len(table)
     return cluster_penalty
 
 
@@ -217,22 +292,70 @@ def compute_header_analysis(table: List[List[str]]) -> float:
     if not table or not table[0]:
         return 0.0
 
-    # Safely handle None values in header row
-    first_row = set(str(cell).lower() for cell in table[0] if cell is not None)
-    header_matches = len(HEADER_KEYWORDS.intersection(first_row))
-    header_score = min(1.0, header_matches / 3)
+    # Count distinct header keywords, stopping once the score saturates at 3
+    matched = set()
+    for cell in table[0]:
+        # Safely handle None values in header row
+        if cell is None:
+            continue
+        word = str(cell).lower()
+        if word in HEADER_KEYWORDS:
+            matched.add(word)
+            if len(matched) == 3:
+                break
+    header_score = min(1.0, len(matched) / 3)
     return header_score
 
 
-def extract_tables_with_pdfplumber(pdf_path: str) -> List[Dict]:
-    """Extract tables using PDFPlumber."""
+def extract_tables_with_pdfplumber(
+    pdf_path: str, check_scanned: bool = True, threshold: float = TQS_THRESHOLD
+) -> Tuple[List[Dict], bool]:
+    """
+    Extract tables using PDFPlumber, optionally checking for a scanned PDF.
+
+    The scanned-PDF check reads the first pages of the document that is
+    already open for table extraction, so each PDF is only parsed once.
+
+    Args:
+        pdf_path: Path to the PDF file
+        check_scanned: Whether to check if the PDF is image-based first
+        threshold: Minimum quality score of the tables to keep
+
+    Returns:
+        Tuple[List[Dict], bool]: Extracted tables, and whether the PDF is
+        image-based (in which case no tables are returned)
+    """
+    # pdfplumber and Camelot are imported on first use: both are slow to
+    # import (Camelot pulls in OpenCV and Ghostscript bindings), and each
+    # pool worker would otherwise pay that at startup
+    import pdfplumber  # noqa: PLC0415
+
+    try:
+        pdf = pdfplumber.open(pdf_path)
+    except Exception as e:
+        if not check_scanned:
+            raise
+        # Like a failed check below, an unreadable PDF is recorded as scanned
+        # rather than failing, so it is not retried on every run
+        logger.error("Error checking PDF %s: %s", pdf_path, e)
+        return [], True
+
     extracted_tables = []
     try:
-        with pdfplumber.open(pdf_path) as pdf:
+        with pdf:
+            if check_scanned:
+                try:
+                    is_scanned = _is_image_based(pdf.pages)
+                except Exception as e:
+                    logger.error("Error checking PDF %s: %s", pdf_path, e)
+                    is_scanned = True  # If error occurs, assume scanned PDF
+                if is_scanned:
+                    return [], True
+
             for page_num, page in enumerate(pdf.pages, start=1):
                 for table in page.extract_tables():
                     quality_score = compute_table_quality(table, page_num)
-                    if quality_score >= TQS_THRESHOLD:
+                    if quality_score >= threshold:
                         extracted_tables.append(
                             {
                                 "page": page_num,
@@ -244,14 +367,54 @@ def extract_tables_with_pdfplumber(pdf_path: str) -> List[Dict]:
                         )
     except FileNotFoundError as e:
         logger.error(
-            f"PDFPlumber extraction failed for {pdf_path} due to a file not found error: {e}"
+            "PDFPlumber extraction failed for %s due to a file not found error: %s",
+            pdf_path,
+            e,
         )
+    return extracted_tables, False
+
+
+def extract_tables_with_pymupdf(
+    pdf_path: str, threshold: float = TQS_THRESHOLD
+) -> List[Dict]:
+    """Extract tables using PyMuPDF's table finder."""
+    extracted_tables = []
+
+    try:
+        import fitz  # noqa: PLC0415  (optional, see _fitz_is_image_based)
+
+        with fitz.open(pdf_path) as doc:
+            for page_num, page in enumerate(doc, start=1):
+                for table in page.find_tables().tables:
+                    rows = table.extract()
+                    quality_score = compute_table_quality(rows, page_num)
+                    if quality_score >= threshold:
+                        extracted_tables.append(
+                            {
+                                "page": page_num,
+                                "table": rows,
+                                "method": "pymupdf",
+                                "quality_score": quality_score,
+                                "extraction_time": datetime.now().isoformat(),
+                            }
+                        )
+    except Exception as e:
+        logger.error("PyMuPDF extraction failed for %s: %s", pdf_path, e)
+
     return extracted_tables
-def extract_tables_with_camelot(pdf_path: str) -> List[Dict]:
+
+
+def extract_tables_with_camelot(
+    pdf_path: str, threshold: float = TQS_THRESHOLD
+) -> List[Dict]:
     """Extract tables using Camelot, trying 'lattice' first, then 'stream'."""
     extracted_tables = []
 
     try:
+        import camelot  # noqa: PLC0415  (lazy, see extract_tables_with_pdfplumber)
+
+        warnings.filterwarnings("ignore", category=UserWarning, module="camelot")
+
         with suppress_stdout():
             # Try lattice mode first
             tables = camelot.read_pdf(pdf_path, flavor="lattice")
@@ -261,7 +424,7 @@ def extract_tables_with_camelot(pdf_path: str) -> List[Dict]:
                         quality_score = compute_table_quality(
                             table.df.values.tolist(), table.page
                         )
-                        if quality_score >= TQS_THRESHOLD:
+                        if quality_score >= threshold:
                             extracted_tables.append(
                                 {
                                     "page": table.page,
@@ -272,111 +435,344 @@ def extract_tables_with_camelot(pdf_path: str) -> List[Dict]:
                                 }
                             )
             else:
-                logger.debug(f"No tables found in {pdf_path} using Camelot.")
+                logger.debug("No tables found in %s using Camelot.", pdf_path)
     except Exception as e:
-        logger.error(f"Camelot extraction failed for {pdf_path}: {e}")
+        logger.error("Camelot extraction failed for %s: %s", pdf_path, e)
 
     return extracted_tables
 
 
-def extract_tables(pdf_path: str) -> List[Dict]:
-    """Extract tables using PDFPlumber first, falling back to Camelot if needed."""
-    if is_image_based_pdf(pdf_path):
-        logger.info(f"🔍 {pdf_path} is image-based, skipping extraction.")
-        return []
-        
-    tables = extract_tables_with_pdfplumber(pdf_path)
+def extract_tables(
+    pdf_path: str,
+    use_camelot: bool = False,
+    scored: Optional[Dict[str, List[Dict]]] = None,
+) -> Tuple[List[Dict], bool]:
+    """
+    Extract tables using PDFPlumber first, falling back to PyMuPDF if needed.
+
+    Camelot's lattice mode is slow (it renders pages through Ghostscript),
+    so it is only tried as a last resort when use_camelot is set.
+
+    Each method's tables are scored without a cutoff and only then filtered
+    by TQS_THRESHOLD, so cached scored tables can be re-filtered without
+    extracting again.
+
+    Args:
+        pdf_path: Path to the PDF file
+        use_camelot: Whether to fall back to Camelot if no other method
+            finds tables
+        scored: Every scored table found so far, keyed by method. Methods
+            already present are not run again; methods that run are added.
+
+    Returns:
+        Tuple[List[Dict], bool]: Extracted tables, and whether the PDF is
+        image-based (scanned), in which case extraction is skipped
+    """
+    if scored is None:
+        scored = {}
+
+    if "pdfplumber" not in scored:
+        # PyMuPDF answers the scanned check far faster than pdfplumber; only
+        # if it cannot read the PDF does pdfplumber check during extraction
+        is_scanned = _fitz_is_image_based(pdf_path)
+        if not is_scanned:
+            scored["pdfplumber"], is_scanned = extract_tables_with_pdfplumber(
+                pdf_path, check_scanned=is_scanned is None, threshold=0.0
+            )
+        if is_scanned:
+            logger.info("🔍 %s is image-based, skipping extraction.", pdf_path)
+            return [], True
+
+    tables = _passing_tables(scored["pdfplumber"])
+    if not tables:
+        if "pymupdf" not in scored:
+            scored["pymupdf"] = extract_tables_with_pymupdf(pdf_path, threshold=0.0)
+        tables = _passing_tables(scored["pymupdf"])
+    if not tables and use_camelot:
+        if "camelot" not in scored:
+            scored["camelot"] = extract_tables_with_camelot(pdf_path, threshold=0.0)
+        tables = _passing_tables(scored["camelot"])
     if not tables:
-        tables = extract_tables_with_camelot(pdf_path)
-        if not tables:
-            logger.warning(f"No tables extracted from {pdf_path} using both pdfplumber and camelot.")
-    
-    return tables
+        logger.warning("No tables extracted from %s with any method.", pdf_path)
+
+    return tables, False
+
+
+def _passing_tables(tables: List[Dict]) -> List[Dict]:
+    """Keep the scored tables that meet TQS_THRESHOLD."""
+    return [table for table in tables if table["quality_score"] >= TQS_THRESHOLD]
+
+
+def _is_image_based(pages) -> bool:
+    """Check whether the first 2 pages of an open PDF have no text."""
+    for page in pages[:2]:
+        text = page.extract_text()
+        if text and text.strip():
+            return False  # Text detected, NOT image-based
+    return True  # No text found, assume it's a scanned PDF
+
+
+def _load_cached_tables(digest: str) -> Optional[Dict]:
+    """
+    Load the cached extraction result for a PDF's content hash.
+
+    Returns:
+        Optional[Dict]: The entry, with "is_scanned" and the "scored" tables
+        per method, or None if there is no entry for the current version
+    """
+    try:
+        entry = _read_json(CACHE_DIR / f"{digest}.json")
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict) or entry.get("version") != CACHE_VERSION:
+        return None
+    return entry
+
+
+def _save_cached_tables(
+    digest: str, is_scanned: bool, scored: Dict[str, List[Dict]]
+) -> None:
+    """Atomically cache an extraction result under a PDF's content hash."""
+    entry = {"version": CACHE_VERSION, "is_scanned": is_scanned, "scored": scored}
+    # JSON rather than pickle: loading a cache file can never run code
+    cache_path = CACHE_DIR / f"{digest}.json"
+    # Workers may cache identical PDFs at once, so temp files are per process
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_dumps_line(entry))
+    os.replace(tmp_path, cache_path)
+
+
+def extract_tables_cached(
+    pdf_path: str, use_camelot: bool = False, force: bool = False
+) -> Tuple[List[Dict], bool]:
+    """
+    Extract tables, reusing the scored tables cached for identical contents.
+
+    Results are keyed by the SHA-256 of the PDF, so renamed copies skip
+    table extraction entirely. The cache holds every scored table before
+    the TQS_THRESHOLD filter, so a new threshold only re-filters them; a
+    fallback method runs (and is cached) the first time a threshold needs
+    it. Tables served from the cache are marked with "cached": True.
+
+    Args:
+        pdf_path: Path to the PDF file
+        use_camelot: Whether to fall back to Camelot, see extract_tables
+        force: Whether to ignore any cached result and extract again; the
+            new result replaces the cached one
+
+    Returns:
+        Tuple[List[Dict], bool]: Extracted tables, and whether the PDF is
+        image-based (scanned)
+    """
+    digest = file_sha256(pdf_path)
+    entry = None if force else _load_cached_tables(digest)
+    if entry is not None and entry["is_scanned"]:
+        return [], True
+
+    scored = {} if entry is None else entry["scored"]
+    cached_methods = set(scored)
+    tables, is_scanned = extract_tables(pdf_path, use_camelot, scored)
+
+    if entry is None or scored.keys() != cached_methods:
+        try:
+            _save_cached_tables(digest, is_scanned, scored)
+        except OSError as e:
+            logger.warning("Could not cache tables for %s: %s", pdf_path, e)
+
+    # Flag cached tables so their original extraction_time is not mistaken
+    # for this run's
+    return [
+        dict(table, cached=True) if table["method"] in cached_methods else table
+        for table in tables
+    ], is_scanned
+
+
+def _fitz_is_image_based(pdf_path: str) -> Optional[bool]:
+    """
+    Check whether the first 2 pages of a PDF have no text, using PyMuPDF.
+
+    Returns:
+        Optional[bool]: Whether the PDF is image-based, or None if PyMuPDF
+        is unavailable or cannot read the file
+    """
+    try:
+        import fitz  # noqa: PLC0415  (optional; pdfplumber is the fallback)
+
+        with fitz.open(pdf_path) as doc:
+            for page in doc.pages(0, min(2, doc.page_count)):
+                if page.get_text("text").strip():
+                    return False  # Text detected, NOT image-based
+        return True  # No text found, assume it's a scanned PDF
+    except Exception as e:
+        logger.debug("PyMuPDF could not check %s: %s", pdf_path, e)
+        return None
 
 
 def is_image_based_pdf(pdf_path: str) -> bool:
     """
     Check if the PDF is image-based (scanned).
 
+    Uses PyMuPDF's C text extraction, falling back to pdfplumber if
+    PyMuPDF cannot read the file.
+
     Args:
         pdf_path: Path to the PDF file.
 
     Returns:
         bool: True if the PDF is image-based (scanned), False otherwise.
     """
+    is_scanned = _fitz_is_image_based(pdf_path)
+    if is_scanned is not None:
+        return is_scanned
+
+    import pdfplumber  # noqa: PLC0415  (lazy, see extract_tables_with_pdfplumber)
+
     try:
         with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages[:2]:  # Check the first 2 pages
-                text = page.extract_text()
-                if text and text.strip():
-                    return False  # Text detected, NOT image-based
-        return True  # No text found, assume it's a scanned PDF
+            return _is_image_based(pdf.pages)
     except Exception as e:
-        logger.error(f"Error checking PDF {pdf_path}: {e}")
+        logger.error("Error checking PDF %s: %s", pdf_path, e)
         return True  # If error occurs, assume scanned PDF
 
 
+def _loads(data: bytes):
+    """Parse JSON from bytes, using orjson when it is installed."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_line(data) -> bytes:
+    """Serialize data as a single line of compact UTF-8 JSON."""
+    if _HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    line = json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n"
+    return line.encode("utf-8")
+
+
+def _read_json(path: Path):
+    """Read a JSON file, using orjson when it is installed."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def _write_json(path: Path, data) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when it is installed."""
+    if _HAS_ORJSON:
+        with open(path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_SERIALIZE_NUMPY,
+                )
+            )
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
 def load_manifest() -> ManifestDict:
     """
     Load the processing manifest from disk.
 
-    This function reads the JSON file containing the processing status of previously processed PDFs.
+    The manifest is a JSON Lines log with one status per line; later lines
+    replace earlier ones for the same file. A line cut short by an
+    interrupted run is ignored.
 
     Returns:
         ManifestDict: Dictionary of previously processed files and their status
     """
+    # Start from the single JSON manifest written by earlier versions, if any
     try:
-        with open(PROCESSED_MANIFEST, "r", encoding="utf-8") as f:
-            return json.load(f)
+        manifest = _read_json(LEGACY_MANIFEST)
     except FileNotFoundError:
-        return {}
+        manifest = {}
+
+    try:
+        with open(PROCESSED_MANIFEST, "rb") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return manifest
+
+    for line in lines:
+        try:
+            status = _loads(line)
+        except ValueError:
+            continue
+        manifest[status["filename"]] = status
+    return manifest
+
+
+def append_manifest(status: ProcessingStatus) -> None:
+    """
+    Append one file's processing status to the manifest.
+
+    Progress is recorded as soon as each PDF finishes, so a crash mid-run
+    keeps everything processed so far.
+
+    Args:
+        status: Processing status of a single file
+    """
+    with open(PROCESSED_MANIFEST, "a+b") as f:
+        # A run killed mid-write leaves a partial last line; start a new line
+        # so this status is not glued onto it and skipped along with it
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write(_dumps_line(status))
 
 
 def save_manifest(manifest: ManifestDict) -> None:
     """
-        Save the processing manifest to disk.
-    
-        This function writes the manifest dictionary to a JSON file.
-    
-        Args:
-            manifest: Dictionary of processed files and their status
-        """
-    with open(PROCESSED_MANIFEST, "w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+    Save the processing manifest to disk.
+
+    Rewrites the manifest log with one line per file, dropping statuses that
+    later appends replaced. The new log is swapped in atomically.
+
+    Args:
+        manifest: Dictionary of processed files and their status
+    """
+    tmp_path = PROCESSED_MANIFEST.with_name(PROCESSED_MANIFEST.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.writelines(_dumps_line(status) for status in manifest.values())
+    os.replace(tmp_path, PROCESSED_MANIFEST)
 
 
 def normalize_table_data(table: List[List[str]]) -> List[List[str]]:
     """
     Normalize table data to ensure all rows have the same length.
-    
+
     Args:
         table: Raw table data as 2D list
-        
+
     Returns:
         Normalized table with consistent row lengths
     """
     if not table:
         return []
-    
+
     try:
-        # Convert None values to empty strings
-        cleaned_table = [
-            ['' if cell is None else str(cell) for cell in row]
-            for row in table
-        ]
-        
-        # Find the maximum row length
-        max_length = max(len(row) for row in cleaned_table)
-        
-        # Pad shorter rows with empty strings
+        # Find the maximum row length; this only reads row lengths
+        max_length = max(map(len, table))
+
+        # Convert None values to empty strings and pad shorter rows with
+        # empty strings, building each row once instead of copying it again
+        # to pad it
         normalized = [
-            row + [''] * (max_length - len(row))
-            for row in cleaned_table
+            ["" if cell is None else str(cell) for cell in row]
+            + [""] * (max_length - len(row))
+            for row in table
         ]
-        
+
         return normalized
     except Exception as e:
-        logger.error(f"Error normalizing table: {str(e)}")
+        logger.error("Error normalizing table: %s", e)
         return []
 
 
@@ -385,7 +781,7 @@ def save_extracted_tables(
 ) -> None:
     """Save extracted tables to a single JSON file per PDF, and optionally to CSV."""
     if not tables:
-        logger.warning(f"No tables to save for {pdf_name}")
+        logger.warning("No tables to save for %s", pdf_name)
         return
 
     pdf_data = {
@@ -398,31 +794,34 @@ def save_extracted_tables(
     for idx, table_data in enumerate(tables, 1):
         try:
             if table_data["quality_score"] >= QUALITY_THRESHOLDS["high"]:
-                # Convert table to DataFrame with proper normalization
-                if table_data["method"] == "pdfplumber":
-                    # Normalize table data before creating DataFrame
-                    normalized_table = normalize_table_data(table_data["table"])
-                    if not normalized_table:
-                        logger.warning(f"Empty or invalid table found in {pdf_name}, table {idx}")
+                # Build rows and column names directly, without a DataFrame
+                if table_data["method"] in ("pdfplumber", "pymupdf"):
+                    # Normalize table data so all rows have the same length
+                    rows = normalize_table_data(table_data["table"])
+                    if not rows:
+                        logger.warning(
+                            "Empty or invalid table found in %s, table %d",
+                            pdf_name,
+                            idx,
+                        )
                         continue
-                        
+
                     # Ensure all rows have the same number of columns
-                    if len(set(len(row) for row in normalized_table)) > 1:
-                        logger.warning(f"Inconsistent row lengths in {pdf_name}, table {idx}")
-                        continue
-                        
-                    df = pd.DataFrame(normalized_table).fillna("")
-                else:  # camelot
-                    try:
-                        df = pd.DataFrame.from_dict(table_data["table"]).fillna("")
-                    except ValueError as e:
-                        logger.error(f"Error converting Camelot table: {str(e)}")
+                    if len(set(len(row) for row in rows)) > 1:
+                        logger.warning(
+                            "Inconsistent row lengths in %s, table %d", pdf_name, idx
+                        )
                         continue
 
+                    columns = range(len(rows[0]))
+                else:  # camelot, stored as DataFrame.to_dict(orient="split")
+                    rows = normalize_table_data(table_data["table"]["data"])
+                    columns = table_data["table"]["columns"]
+
                 # Clean column names
-                df.columns = [
+                column_names = [
                     str(col).strip() if col is not None else f"column_{i}"
-                    for i, col in enumerate(df.columns)
+                    for i, col in enumerate(columns)
                 ]
 
                 # Add table metadata and data to the PDF's JSON
@@ -432,10 +831,11 @@ def save_extracted_tables(
                     "extraction_method": table_data["method"],
                     "quality_score": table_data["quality_score"],
                     "extraction_time": table_data["extraction_time"],
-                    "num_rows": len(df),
-                    "num_columns": len(df.columns),
-                    "column_names": df.columns.tolist(),
-                    "table_data": df.to_dict(orient="records"),
+                    "from_cache": table_data.get("cached", False),
+                    "num_rows": len(rows),
+                    "num_columns": len(column_names),
+                    "column_names": column_names,
+                    "table_data": [dict(zip(column_names, row)) for row in rows],
                 }
                 pdf_data["tables"].append(table_info)
 
@@ -443,44 +843,57 @@ def save_extracted_tables(
                 if save_csv:
                     csv_filename = f"{pdf_name}_table_{idx}.csv"
                     csv_path = TABLE_CSV_DIR / csv_filename
-                    df.to_csv(csv_path, index=False)
+                    # Rows are already normalized strings, so they are
+                    # written as-is; "\n" line endings on every platform
+                    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+                        writer = csv.writer(f, lineterminator="\n")
+                        writer.writerow(column_names)
+                        writer.writerows(rows)
 
         except Exception as e:
-            logger.error(f"Failed to process table {idx} in {pdf_name}: {str(e)}")
+            logger.error("Failed to process table %d in %s: %s", idx, pdf_name, e)
             continue
 
     # Save the combined JSON file
     try:
         json_path = TABLE_JSON_DIR / f"{pdf_name}.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(pdf_data, f, indent=2, ensure_ascii=False)
+        _write_json(json_path, pdf_data)
 
         logger.info(
-            f"Saved {len(pdf_data['tables'])} tables from {pdf_name}"
-            f"{' (with CSV files)' if save_csv else ''}"
+            "Saved %d tables from %s%s",
+            len(pdf_data["tables"]),
+            pdf_name,
+            " (with CSV files)" if save_csv else "",
         )
     except Exception as e:
-        logger.error(f"Failed to save JSON for {pdf_name}: {str(e)}")
+        logger.error("Failed to save JSON for %s: %s", pdf_name, e)
 
 
 def process_pdf(
-    pdf_path: Path, manifest: ManifestDict, save_csv: bool = False
+    pdf_path: Path,
+    manifest: ManifestDict,
+    save_csv: bool = False,
+    use_camelot: bool = False,
+    force: bool = False,
 ) -> Dict[str, Union[str, bool, int, float, list, dict]]:
     """
     Process a single PDF file and extract tables.
 
-    This function checks if the PDF is scanned, extracts tables using pdfplumber and camelot,
-    filters for high-quality tables, and saves the results.
+    This function checks if the PDF is scanned, extracts tables using pdfplumber,
+    PyMuPDF and optionally camelot, filters for high-quality tables, and saves the results.
 
     Args:
         pdf_path: Path to the PDF file
         manifest: Current processing manifest
         save_csv: Whether to save individual tables as CSV files
+        use_camelot: Whether to fall back to Camelot if no other method finds tables
+        force: Whether to re-extract even if a cached result exists
     """
     pdf_name = pdf_path.stem
 
-    # Step 1: Check if the PDF is scanned (image-based)
-    if is_image_based_pdf(pdf_path):
+    # Step 1: Extract tables, which also checks whether the PDF is scanned
+    tables, is_scanned = extract_tables_cached(pdf_path, use_camelot, force)
+    if is_scanned:
         manifest[pdf_name] = {
             "filename": pdf_name,
             "processed_date": datetime.now().isoformat(),
@@ -494,19 +907,16 @@ def process_pdf(
         }
         return manifest[pdf_name]
 
-    # Step 2: Extract tables using pdfplumber first
-    tables = extract_tables(pdf_path)
-
-    # Step 3: Filter for high-quality tables
+    # Step 2: Filter for high-quality tables
     high_quality_tables = [
         t for t in tables if t["quality_score"] >= QUALITY_THRESHOLDS["high"]
     ]
 
-    # Step 4: Save tables if any high-quality ones were found
+    # Step 3: Save tables if any high-quality ones were found
     if high_quality_tables:
         save_extracted_tables(pdf_name, high_quality_tables, save_csv)
 
-    # Step 5: Update status
+    # Step 4: Update status
     status = {
         "filename": pdf_name,
         "processed_date": datetime.now().isoformat(),
@@ -533,6 +943,18 @@ def process_pdf(
     return status
 
 
+def _process_pdf_worker(
+    pdf_path: Path, save_csv: bool, use_camelot: bool, force: bool
+) -> Dict[str, Union[str, bool, int, float, list, dict]]:
+    """
+    Process one PDF in a worker process.
+
+    The worker only sees a private manifest; the parent records the returned
+    status, so the shared manifest is never written concurrently.
+    """
+    return process_pdf(pdf_path, {}, save_csv, use_camelot, force)
+
+
 def main():
     """Main execution function with manifest tracking."""
     parser = argparse.ArgumentParser(
@@ -541,11 +963,16 @@ def main():
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Force reprocessing of all PDFs, ignoring existing results",
+        help="Force reprocessing of all PDFs, ignoring existing and cached results",
     )
     parser.add_argument(
         "--save-csv", action="store_true", help="Additionally save tables as CSV files"
     )
+    parser.add_argument(
+        "--use-camelot",
+        action="store_true",
+        help="Fall back to Camelot (slow) when no other method finds tables",
+    )
     args = parser.parse_args()
 
     setup_environment()
@@ -561,45 +988,74 @@ def main():
         return
 
     # Initialize counters
-    stats = {"processed": 0, "skipped": 0, "failed": 0, "no_tables": 0}
+    stats = {"processed": 0, "skipped": 0, "failed": 0, "no_tables": 0, "crashed": 0}
+
+    # Skip already processed PDFs unless forcing
+    pending = []
+    for pdf_path in pdf_files:
+        if pdf_path.stem in manifest and not args.force:
+            stats["skipped"] += 1
+        else:
+            pending.append(pdf_path)
 
     # Configure progress bar
     with tqdm(
         total=len(pdf_files),
+        initial=stats["skipped"],
         desc="Processing PDFs",
         unit="file",
         ncols=100,
         bar_format="{desc:<30} |{bar:50}| {percentage:3.0f}% [{n_fmt}/{total_fmt}]",
         disable=None,
-    ) as progress_bar:
-        for pdf_path in pdf_files:
-            pdf_name = pdf_path.stem
-            progress_bar.set_description(f"Processing {pdf_name[:20]}")
+    ) as progress_bar, ProcessPoolExecutor(
+        max_workers=os.cpu_count(), initializer=setup_logging
+    ) as executor:
+        # Each PDF is parsed and scored independently, so fan out across cores
+        futures = {
+            executor.submit(
+                _process_pdf_worker,
+                pdf_path,
+                args.save_csv,
+                args.use_camelot,
+                args.force,
+            ): pdf_path
+            for pdf_path in pending
+        }
 
-            # Skip if already processed and not forcing
-            if pdf_name in manifest and not args.force:
-                stats["skipped"] += 1
-                progress_bar.update(1)
-                continue
+        for future in as_completed(futures):
+            pdf_name = futures[future].stem
+            progress_bar.set_description(f"Processing {pdf_name[:20]}")
 
             try:
-                status = process_pdf(pdf_path, manifest, args.save_csv)
+                status = future.result()
                 if status["has_tables"]:
                     stats["processed"] += 1
                 else:
                     stats["no_tables"] += 1
+            except BrokenProcessPool as e:
+                # A worker died (e.g. a segfault in a PDF library or an OOM
+                # kill), failing every PDF still pending. These say nothing
+                # about the PDFs themselves, so they stay out of the manifest
+                # and are retried on the next run.
+                logger.error("Worker crashed before finishing %s: %s", pdf_name, e)
+                stats["crashed"] += 1
+                progress_bar.update(1)
+                continue
             except Exception as e:
-                logger.error(f"Failed to process {pdf_name}: {str(e)}")
+                logger.error("Failed to process %s: %s", pdf_name, e)
                 stats["failed"] += 1
-                manifest[pdf_name] = {
+                status = {
                     "filename": pdf_name,
                     "processed_date": datetime.now().isoformat(),
                     "error": str(e),
                     "success": False,
                 }
 
+            manifest[pdf_name] = status
+            append_manifest(status)
             progress_bar.update(1)
 
+    # Compact the log now that the run is complete
     save_manifest(manifest)
 
     # Print final summary to console
@@ -609,6 +1065,8 @@ def main():
     print(f"{'Skipped files:':<20} {stats['skipped']}")
     if stats["failed"]:
         print(f"{'Failed files:':<20} {stats['failed']}")
+    if stats["crashed"]:
+        print(f"{'Crashed, will retry:':<20} {stats['crashed']}")
     print("\n✅ Processing complete!")
 
 
@@ -7,6 +7,7 @@ import logging
 import os
 import shutil
 import subprocess
+from functools import lru_cache
 from typing import List, Optional, TypedDict
 
 
@@ -19,10 +20,143 @@ class DependencyInfo(TypedDict):
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Upper bound on a "--version" probe, so a hung executable cannot block callers
+VERSION_TIMEOUT: float = 2.0
+
+
+@lru_cache(maxsize=1)
+def _check_tesseract() -> DependencyInfo:
+    """Check for Tesseract OCR; see DependencyManager.check_tesseract."""
+    result: DependencyInfo = {"available": False, "path": None, "version": None}
+
+    # First check if pytesseract is installed
+    if importlib.util.find_spec("pytesseract") is None:
+        logger.warning("pytesseract package not installed")
+        return result
+
+    # Check for tesseract in PATH
+    tesseract_path: Optional[str] = shutil.which("tesseract")
+
+    # On Windows, also check common installation directories
+    if not tesseract_path and os.name == "nt":
+        common_paths: List[str] = [
+            r"C:\Program Files\Tesseract-OCR\tesseract.exe",
+            r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
+        ]
+        for path in common_paths:
+            if os.path.exists(path):
+                tesseract_path = path
+                break
+
+    if tesseract_path:
+        result["available"] = True
+        result["path"] = tesseract_path
+
+        # Get version
+        try:
+            version_output = subprocess.run(
+                [tesseract_path, "--version"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                check=False,
+                timeout=VERSION_TIMEOUT,
+            )
+            if version_output.returncode == 0:
+                # Extract version from output
+                version_line = version_output.stdout.split("\n")[0]
+                result["version"] = version_line.strip()
+        except Exception as e:
+            logger.error(f"Failed to get Tesseract version: {e}")
+
+    return result
+
+
+@lru_cache(maxsize=1)
+def _check_ffmpeg() -> DependencyInfo:
+    """Check for ffmpeg; see DependencyManager.check_ffmpeg."""
+    result: DependencyInfo = {"available": False, "path": None, "version": None}
+
+    # Check for ffmpeg in PATH
+    ffmpeg_path: Optional[str] = shutil.which("ffmpeg")
+
+    if ffmpeg_path:
+        result["available"] = True
+        result["path"] = ffmpeg_path
+
+        # Get version
+        try:
+            version_output = subprocess.run(
+                [ffmpeg_path, "-version"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                check=False,
+                timeout=VERSION_TIMEOUT,
+            )
+            if version_output.returncode == 0:
+                # Extract version from output
+                version_line = version_output.stdout.split("\n")[0]
+                result["version"] = version_line.strip()
+        except Exception as e:
+            logger.error(f"Failed to get ffmpeg version: {e}")
+
+    return result
+
+
+@lru_cache(maxsize=1)
+def _check_ghostscript() -> DependencyInfo:
+    """Check for Ghostscript; see DependencyManager.check_ghostscript."""
+    result: DependencyInfo = {"available": False, "path": None, "version": None}
+
+    # Check for different executables based on platform
+    if os.name == "nt":  # Windows
+        gs_execs = ["gswin64c", "gswin32c"]
+    else:  # Unix-like
+        gs_execs = ["gs"]
+
+    for exec_name in gs_execs:
+        gs_path: Optional[str] = shutil.which(exec_name)
+        if gs_path:
+            result["available"] = True
+            result["path"] = gs_path
+
+            # Get version
+            try:
+                version_output = subprocess.run(
+                    [gs_path, "--version"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    check=False,
+                    timeout=VERSION_TIMEOUT,
+                )
+                if version_output.returncode == 0:
+                    result["version"] = version_output.stdout.strip()
+            except Exception as e:
+                logger.error(f"Failed to get Ghostscript version: {e}")
+
+            # We found a valid executable, so break
+            break
+
+    return result
+
+
+def _copy(info: DependencyInfo) -> DependencyInfo:
+    """Copy a cached result so callers cannot modify the cache."""
+    return {
+        "available": info["available"],
+        "path": info["path"],
+        "version": info["version"],
+    }
+
 
 class DependencyManager:
     """
     Manages external dependencies and provides fallbacks when they're not available.
+
+    Each check runs once per process; later calls reuse the result instead of
+    spawning the executable again. Use clear_cache() to force a re-check.
     """
 
     @staticmethod
@@ -36,47 +170,7 @@ class DependencyManager:
                 - path (str): Path to Tesseract executable if found
                 - version (str): Version string if available
         """
-        result: DependencyInfo = {"available": False, "path": None, "version": None}
-
-        # First check if pytesseract is installed
-        if importlib.util.find_spec("pytesseract") is None:
-            logger.warning("pytesseract package not installed")
-            return result
-
-        # Check for tesseract in PATH
-        tesseract_path: Optional[str] = shutil.which("tesseract")
-
-        # On Windows, also check common installation directories
-        if not tesseract_path and os.name == "nt":
-            common_paths: List[str] = [
-                r"C:\Program Files\Tesseract-OCR\tesseract.exe",
-                r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
-            ]
-            for path in common_paths:
-                if os.path.exists(path):
-                    tesseract_path = path
-                    break
-
-        if tesseract_path:
-            result["available"] = True
-            result["path"] = tesseract_path
-
-            # Get version
-            try:
-                version_output = subprocess.run(
-                    [tesseract_path, "--version"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if version_output.returncode == 0:
-                    # Extract version from output
-                    version_line = version_output.stdout.split("\n")[0]
-                    result["version"] = version_line.strip()
-            except Exception as e:
-                logger.error(f"Failed to get Tesseract version: {e}")
-
-        return result
+        return _copy(_check_tesseract())
 
     @staticmethod
     def check_ffmpeg() -> DependencyInfo:
@@ -89,31 +183,7 @@ class DependencyManager:
                 - path (str): Path to ffmpeg executable if found
                 - version (str): Version string if available
         """
-        result: DependencyInfo = {"available": False, "path": None, "version": None}
-
-        # Check for ffmpeg in PATH
-        ffmpeg_path: Optional[str] = shutil.which("ffmpeg")
-
-        if ffmpeg_path:
-            result["available"] = True
-            result["path"] = ffmpeg_path
-
-            # Get version
-            try:
-                version_output = subprocess.run(
-                    [ffmpeg_path, "-version"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if version_output.returncode == 0:
-                    # Extract version from output
-                    version_line = version_output.stdout.split("\n")[0]
-                    result["version"] = version_line.strip()
-            except Exception as e:
-                logger.error(f"Failed to get ffmpeg version: {e}")
-
-        return result
+        return _copy(_check_ffmpeg())
 
     @staticmethod
     def check_ghostscript() -> DependencyInfo:
@@ -126,37 +196,14 @@ class DependencyManager:
                 - path (str): Path to Ghostscript executable if found
                 - version (str): Version string if available
         """
-        result: DependencyInfo = {"available": False, "path": None, "version": None}
-
-        # Check for different executables based on platform
-        if os.name == "nt":  # Windows
-            gs_execs = ["gswin64c", "gswin32c"]
-        else:  # Unix-like
-            gs_execs = ["gs"]
-
-        for exec_name in gs_execs:
-            gs_path: Optional[str] = shutil.which(exec_name)
-            if gs_path:
-                result["available"] = True
-                result["path"] = gs_path
-
-                # Get version
-                try:
-                    version_output = subprocess.run(
-                        [gs_path, "--version"],
-                        capture_output=True,
-                        text=True,
-                        check=False,
-                    )
-                    if version_output.returncode == 0:
-                        result["version"] = version_output.stdout.strip()
-                except Exception as e:
-                    logger.error(f"Failed to get Ghostscript version: {e}")
-
-                # We found a valid executable, so break
-                break
+        return _copy(_check_ghostscript())
 
-        return result
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached check results, e.g. after installing a dependency."""
+        _check_tesseract.cache_clear()
+        _check_ffmpeg.cache_clear()
+        _check_ghostscript.cache_clear()
 
     @staticmethod
     def configure_pytesseract() -> None:
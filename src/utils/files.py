@@ -0,0 +1,41 @@
+"""
+Utility module for writing output files safely.
+"""
+
+import contextlib
+import os
+
+# O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def atomic_write_text(path: str, data: str) -> None:
+    """
+    Write text to a file atomically.
+
+    The text is written to a temporary file next to the target and moved into
+    place with os.replace, so an interrupted run never leaves a truncated file
+    that a later run would mistake for finished output. The text is encoded
+    once and written with raw os.write calls, bypassing the text-mode
+    encoder and buffer; newlines are written as-is on every platform.
+
+    Args:
+        path: Path of the file to write
+        data: Text to write, encoded as UTF-8
+    """
+    tmp_path = path + ".tmp"
+    view = memoryview(data.encode("utf-8"))
+    fd = os.open(tmp_path, _WRITE_FLAGS, 0o666)
+    try:
+        try:
+            # os.write may write fewer bytes than requested
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a partial temporary file next to the output
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,68 @@
+"""
+Utility module for building per-file processing jobs from a data directory.
+"""
+
+import fnmatch
+import os
+import re
+from functools import lru_cache
+from typing import List, NamedTuple, Pattern
+
+
+class Job(NamedTuple):
+    name: str
+    input_path: str
+    output_path: str
+    output_exists: bool
+
+
+@lru_cache(maxsize=None)
+def _input_pattern(in_ext: str) -> Pattern[str]:
+    """Compile a case-insensitive filter for non-hidden files with in_ext."""
+    return re.compile(r"(?!\._)" + fnmatch.translate("*" + in_ext), re.IGNORECASE)
+
+
+def collect_jobs(in_dir: str, in_ext: str, out_dir: str, out_ext: str) -> List[Job]:
+    """
+    Pair every input file in a directory with its output path.
+
+    Each directory is read once: the input directory to find matching files
+    and the output directory to learn which outputs already exist, so no
+    per-file stat of the output path is needed.
+
+    Args:
+        in_dir: Directory containing the input files
+        in_ext: Input file extension, e.g. ".mp3" (matched case-insensitively)
+        out_dir: Directory the output files are written to
+        out_ext: Output file extension, e.g. ".txt"
+
+    Returns:
+        List[Job]: One job per input file, skipping hidden "._" files
+    """
+    match = _input_pattern(in_ext).match
+    # Every match ends in in_ext, so its stem is a plain slice and the output
+    # path a concatenation; no per-file splitext/join calls
+    ext_len = len(in_ext)
+    out_prefix = os.path.join(out_dir, "")
+
+    try:
+        with os.scandir(out_dir) as entries:
+            existing = {entry.name for entry in entries}
+    except FileNotFoundError:
+        existing = set()
+
+    jobs = []
+    with os.scandir(in_dir) as entries:
+        for entry in entries:
+            if not entry.is_file() or not match(entry.name):
+                continue
+            output_name = entry.name[:-ext_len] + out_ext
+            jobs.append(
+                Job(
+                    name=entry.name,
+                    input_path=entry.path,
+                    output_path=out_prefix + output_name,
+                    output_exists=output_name in existing,
+                )
+            )
+    return jobs
@@ -0,0 +1,103 @@
+"""
+Utility module for tracking processed input files between runs.
+
+A manifest is a small JSON sidecar mapping input file names to a fingerprint
+of their contents, so unchanged inputs can be skipped without reprocessing.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional, TypedDict
+
+from src.utils.files import atomic_write_text
+
+MANIFEST_NAME = ".manifest.json"
+
+
+class FileFingerprint(TypedDict):
+    mtime_ns: int
+    size: int
+    sha256: str
+
+
+Manifest = Dict[str, FileFingerprint]
+
+
+def load_manifest(directory: str, name: str = MANIFEST_NAME) -> Manifest:
+    """
+    Load a manifest from disk.
+
+    Args:
+        directory: Directory containing the manifest file
+        name: File name of the manifest
+
+    Returns:
+        Manifest: Mapping of input names to fingerprints, empty if none exists
+    """
+    try:
+        with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(
+    directory: str, manifest: Manifest, name: str = MANIFEST_NAME
+) -> None:
+    """
+    Atomically write a manifest to disk.
+
+    An interrupted run never leaves a truncated manifest behind.
+
+    Args:
+        directory: Directory to write the manifest file to
+        manifest: Mapping of input names to fingerprints
+        name: File name of the manifest
+    """
+    atomic_write_text(os.path.join(directory, name), json.dumps(manifest, indent=2))
+
+
+def file_sha256(path: str) -> str:
+    """
+    Compute the SHA-256 hex digest of a file's contents.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        str: Hex digest of the file contents
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def fingerprint_file(
+    path: str, previous: Optional[FileFingerprint] = None
+) -> FileFingerprint:
+    """
+    Fingerprint a file by modification time, size and SHA-256 digest.
+
+    The file is only hashed when its (mtime, size) pair differs from the
+    previous fingerprint; otherwise the previous fingerprint is reused.
+
+    Args:
+        path: Path to the file
+        previous: Fingerprint recorded on an earlier run, if any
+
+    Returns:
+        FileFingerprint: The current fingerprint of the file
+    """
+    stat = os.stat(path)
+    if (
+        previous is not None
+        and previous["mtime_ns"] == stat.st_mtime_ns
+        and previous["size"] == stat.st_size
+    ):
+        return previous
+
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": file_sha256(path),
+    }
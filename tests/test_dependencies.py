@@ -7,6 +7,14 @@ import pytest
 from src.utils.dependencies import DependencyManager
 
 
+@pytest.fixture(autouse=True)
+def clear_dependency_cache():
+    """Fixture to run every test against fresh, uncached dependency checks."""
+    DependencyManager.clear_cache()
+    yield
+    DependencyManager.clear_cache()
+
+
 @pytest.fixture
 def mock_which():
     """Fixture to mock shutil.which."""
@@ -72,3 +80,15 @@ def test_check_ghostscript(mock_which, mock_subprocess):
     assert result["available"] is True
     assert result["path"] == "/usr/bin/gs"
     assert result["version"] == "Mock version 1.0"
+
+
+def test_checks_are_cached(mock_which, mock_subprocess):
+    """Test that repeated checks do not run the executable again."""
+    mock_which.return_value = "/usr/bin/ffmpeg"
+
+    first = DependencyManager.check_ffmpeg()
+    first["version"] = "modified"
+    second = DependencyManager.check_ffmpeg()
+
+    assert mock_subprocess.call_count == 1
+    assert second["version"] == "Mock version 1.0"
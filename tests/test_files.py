@@ -0,0 +1,31 @@
+"""Tests for the safe file writing utilities."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.files import atomic_write_text
+
+
+def test_atomic_write_text(tmp_path):
+    """Test that text is written as UTF-8 and no temp file is left behind."""
+    path = tmp_path / "out.txt"
+
+    atomic_write_text(str(path), "café\nline 2\n")
+
+    assert path.read_bytes() == "café\nline 2\n".encode("utf-8")
+    assert os.listdir(tmp_path) == ["out.txt"]
+
+
+def test_atomic_write_text_failure_removes_temp_file(tmp_path):
+    """Test that a failed write keeps the old file and removes the temp file."""
+    path = tmp_path / "out.txt"
+    path.write_text("old", encoding="utf-8")
+
+    with patch("src.utils.files.os.write", side_effect=OSError("disk full")):
+        with pytest.raises(OSError, match="disk full"):
+            atomic_write_text(str(path), "new")
+
+    assert path.read_text(encoding="utf-8") == "old"
+    assert os.listdir(tmp_path) == ["out.txt"]
@@ -0,0 +1,32 @@
+"""Tests for the job collection utility."""
+
+from src.utils.jobs import collect_jobs
+
+
+def test_collect_jobs(tmp_path):
+    """Test that inputs are filtered and paired with their outputs."""
+    in_dir = tmp_path / "in"
+    out_dir = tmp_path / "out"
+    in_dir.mkdir()
+    out_dir.mkdir()
+    for name in ["a.mp3", "B.MP3", "._a.mp3", "notes.txt"]:
+        (in_dir / name).write_bytes(b"")
+    (in_dir / "dir.mp3").mkdir()
+    (out_dir / "a.txt").write_text("done")
+
+    jobs = collect_jobs(str(in_dir), ".mp3", str(out_dir), ".txt")
+    jobs = {job.name: job for job in jobs}
+
+    assert sorted(jobs) == ["B.MP3", "a.mp3"]
+    assert jobs["a.mp3"].output_exists is True
+    assert jobs["B.MP3"].output_exists is False
+    assert jobs["B.MP3"].output_path == str(out_dir / "B.txt")
+
+
+def test_collect_jobs_missing_output_dir(tmp_path):
+    """Test that a missing output directory means no outputs exist."""
+    (tmp_path / "a.mp3").write_bytes(b"")
+
+    jobs = collect_jobs(str(tmp_path), ".mp3", str(tmp_path / "missing"), ".txt")
+
+    assert [job.output_exists for job in jobs] == [False]
@@ -0,0 +1,42 @@
+"""Tests for the input manifest utilities."""
+
+import os
+
+from src.utils.manifest import fingerprint_file, load_manifest, save_manifest
+
+
+def test_load_manifest_missing(tmp_path):
+    """Test that a missing manifest loads as empty."""
+    assert load_manifest(str(tmp_path)) == {}
+
+
+def test_save_and_load_manifest(tmp_path):
+    """Test that a saved manifest round-trips and leaves no temp file."""
+    manifest = {"a.mp3": {"mtime_ns": 1, "size": 2, "sha256": "abc"}}
+
+    save_manifest(str(tmp_path), manifest)
+
+    assert load_manifest(str(tmp_path)) == manifest
+    assert os.listdir(tmp_path) == [".manifest.json"]
+
+
+def test_fingerprint_file_reuses_previous(tmp_path):
+    """Test that an unchanged file is not re-hashed."""
+    path = tmp_path / "input.bin"
+    path.write_bytes(b"data")
+
+    fingerprint = fingerprint_file(str(path))
+    previous = dict(fingerprint, sha256="cached")
+
+    assert fingerprint_file(str(path), previous) is previous
+
+
+def test_fingerprint_file_detects_change(tmp_path):
+    """Test that a changed file gets a new digest."""
+    path = tmp_path / "input.bin"
+    path.write_bytes(b"data")
+    fingerprint = fingerprint_file(str(path))
+
+    path.write_bytes(b"new data")
+
+    assert fingerprint_file(str(path), fingerprint)["sha256"] != fingerprint["sha256"]